@@ -1,6 +1,6 @@
 """Core module for Minesweeper solver."""
 
-from .variant_rules import VariantRules
+from .variant_rules import VariantRules, get_neighbors, is_odd_cell
 from .solver import MinesweeperSolver
 from .constants import (
     CELL_UNKNOWN,
@@ -12,12 +12,15 @@ from .constants import (
     VARIANT_CROSS,
     VARIANT_PARTITION,
     VARIANT_TYPES,
+    VARIANT_INDEX,
     DEFAULT_SIZE,
     DEFAULT_MINES,
 )
 
 __all__ = [
     "VariantRules",
+    "get_neighbors",
+    "is_odd_cell",
     "MinesweeperSolver",
     "CELL_UNKNOWN",
     "CELL_FLAG",
@@ -28,6 +31,7 @@ __all__ = [
     "VARIANT_CROSS",
     "VARIANT_PARTITION",
     "VARIANT_TYPES",
+    "VARIANT_INDEX",
     "DEFAULT_SIZE",
     "DEFAULT_MINES",
 ]
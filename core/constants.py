@@ -24,3 +24,7 @@ VARIANT_TYPES = [
     VARIANT_CROSS,
     VARIANT_PARTITION,
 ]
+
+# Variant name -> position in VARIANT_TYPES, for O(1) membership and
+# index lookups instead of linear list scans
+VARIANT_INDEX = {variant: index for index, variant in enumerate(VARIANT_TYPES)}
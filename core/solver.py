@@ -1,7 +1,9 @@
 """Minesweeper solver using Z3 theorem prover."""
 
+from functools import lru_cache
 from typing import List, Tuple, Optional
 
+import numpy as np
 import z3
 
 from .constants import (
@@ -11,7 +13,114 @@ from .constants import (
     VARIANT_ODD_EVEN,
     VARIANT_PARTITION,
 )
-from .variant_rules import VariantRules
+from .variant_rules import get_neighbors
+
+try:
+    from numba import njit
+except ImportError:  # Numba is an optional accelerator
+    njit = None
+
+# Z3Py guards every expression-building wrapper (Bool, ==, And, add, ...)
+# with internal sanity assertions; the constraint builders here call those
+# wrappers thousands of times per solve, so turn the dead checks off.
+# Running the interpreter with -O has the same effect via __debug__.
+try:
+    z3.z3.Z3_DEBUG = False
+except AttributeError:  # older bindings without the module flag
+    pass
+
+
+def _make_solver() -> z3.Solver:
+    """Create a solver tuned for this problem class.
+
+    Every constraint emitted here ranges over Bool cell variables with
+    pseudo-boolean and bounded If-sum arithmetic, so the finite-domain
+    logic (QF_FD) applies and skips the general-purpose preprocessing and
+    theory dispatch of the default solver.
+
+    Returns:
+        z3.Solver instance
+    """
+    try:
+        return z3.SolverFor("QF_FD")
+    except z3.Z3Exception:
+        return z3.Solver()
+
+
+def _local_propagate_kernel(board, nbr_r, nbr_c, nbr_count, rows, cols):
+    """Run the unit-propagation rules to fixed point over flat arrays.
+
+    Plain numeric loops over the structure-of-arrays neighbor tables, so
+    the function can be JIT-compiled by Numba when it is installed; the
+    pure-Python version is used otherwise.
+
+    Args:
+        board: int8 array of shape (rows, cols) with cell values
+        nbr_r: int32 neighbor row table of shape (rows*cols, 8)
+        nbr_c: int32 neighbor col table of shape (rows*cols, 8)
+        nbr_count: int32 vector of neighbor counts per cell
+        rows: Number of rows in the grid
+        cols: Number of columns in the grid
+
+    Returns:
+        Tuple of (state, ok) where state is an int8 vector per cell
+        (0=undecided, 1=safe, 2=mine) and ok is False on contradiction
+    """
+    state = np.zeros(rows * cols, dtype=np.int8)
+    changed = True
+    while changed:
+        changed = False
+        for idx in range(rows * cols):
+            val = board[idx // cols, idx % cols]
+            if val < 0:
+                continue
+            mines = 0
+            unknown = 0
+            for k in range(nbr_count[idx]):
+                nr = nbr_r[idx, k]
+                nc = nbr_c[idx, k]
+                nidx = nr * cols + nc
+                v = board[nr, nc]
+                if v == CELL_FLAG or state[nidx] == 2:
+                    mines += 1
+                elif v == CELL_UNKNOWN and state[nidx] == 0:
+                    unknown += 1
+            remaining = val - mines
+            if remaining < 0 or remaining > unknown:
+                return state, False
+            if unknown == 0 or (remaining != 0 and remaining != unknown):
+                continue
+            mark = 1 if remaining == 0 else 2
+            for k in range(nbr_count[idx]):
+                nr = nbr_r[idx, k]
+                nc = nbr_c[idx, k]
+                nidx = nr * cols + nc
+                if board[nr, nc] == CELL_UNKNOWN and state[nidx] == 0:
+                    state[nidx] = mark
+            changed = True
+    return state, True
+
+
+if njit is not None:
+    _local_propagate_kernel = njit(cache=True)(_local_propagate_kernel)
+
+
+@lru_cache(maxsize=None)
+def _bool_var_grid(rows: int, cols: int) -> tuple:
+    """Build the memoised grid of Z3 Bool cell variables for a grid shape.
+
+    The variables are a pure function of (rows, cols), so solver instances
+    with the same shape (e.g. across variant switches) share one grid and
+    skip the per-cell z3.Bool wrapper calls entirely.
+
+    Args:
+        rows: Number of rows in the grid
+        cols: Number of columns in the grid
+
+    Returns:
+        Tuple of tuples of z3.BoolRef, indexed [row][col]
+    """
+    return tuple(tuple(z3.Bool(f"c_{r}_{c}") for c in range(cols)) for r in range(rows))
 
 
 class MinesweeperSolver:
@@ -30,7 +139,7 @@ class MinesweeperSolver:
         Args:
             rows: Number of rows in the grid
             cols: Number of columns in the grid
-            board_state: 2D list of cell values (-2=flag, -1=unknown, 0-8=revealed count)
+            board_state: 2D array-like of cell values (-2=flag, -1=unknown, 0-8=revealed count)
             variant_type: Type of variant ("Standard", "Knight", "OddEven", "Cross", or "Partition")
             total_mines: Optional total number of mines in the grid
         """
@@ -40,9 +149,12 @@ class MinesweeperSolver:
         self.variant = variant_type
         self.total_mines = total_mines
 
-        # Cache for neighbor calculations
-        self.neighbor_cache = None
+        # Flat structure-of-arrays neighbor tables (indexed by r * cols + c)
+        self.nbr_r = None
+        self.nbr_c = None
+        self.nbr_count = None
         self.is_odd_matrix = None
+        self.nbr_weights = None
 
         # Precompute data for performance optimization
         self._precompute_data()
@@ -56,16 +168,395 @@ class MinesweeperSolver:
         if self.variant == VARIANT_ODD_EVEN:
             self._precompute_parity()
 
+        # Resolve the variant dispatch once here instead of re-branching on
+        # self.variant for every cell inside solve()'s board scan
+        if self.variant == VARIANT_ODD_EVEN:
+            self._build_cell_exprs = self._build_oddeven_cell
+            self._build_unknown_exprs = self._build_oddeven_bounds
+        elif self.variant == VARIANT_PARTITION:
+            self._build_cell_exprs = self._build_partition_cell
+            self._build_unknown_exprs = self._build_partition_bounds
+        else:
+            self._build_cell_exprs = self._build_standard_cell
+            self._build_unknown_exprs = self._build_standard_bounds
+
+        # Z3 variables depend only on the grid shape, not on board state:
+        # reuse the memoised per-shape grid instead of re-rendering names
+        # and z3.Bool wrappers for every solver instance
+        self.z3_vars = _bool_var_grid(self.rows, self.cols)
+
+        # Persistent solver plus a cache of per-(cell, value) constraint
+        # expressions: consecutive solves differ in a handful of cells, so
+        # unchanged cells reuse their already-built ASTs and the solver
+        # object itself survives across clicks (board-state assertions live
+        # in a push/pop frame per solve)
+        self._solver = _make_solver()
+        self._assert_cache = {}
+
     def _precompute_neighbors(self):
-        """Precompute neighbor lists for all cells to avoid repeated calculations."""
-        self.neighbor_cache = {}
+        """Precompute neighbor tables for all cells to avoid repeated calculations.
+
+        Neighbors are stored as flat structure-of-arrays int32 matrices
+        (``nbr_r``/``nbr_c`` padded with -1, plus a ``nbr_count`` vector)
+        rather than a dict of tuple lists: contiguous arrays avoid the
+        per-cell list/tuple allocations and can be consumed directly by
+        vectorized or compiled kernels.
+        """
+        num_cells = self.rows * self.cols
+        max_nbrs = 8  # every supported variant has at most 8 offsets
+        self.nbr_r = np.full((num_cells, max_nbrs), -1, dtype=np.int32)
+        self.nbr_c = np.full((num_cells, max_nbrs), -1, dtype=np.int32)
+        self.nbr_count = np.zeros(num_cells, dtype=np.int32)
+        get_nb = get_neighbors  # local binding for the rows*cols-iteration loop
         for r in range(self.rows):
             for c in range(self.cols):
-                self.neighbor_cache[(r, c)] = VariantRules.get_neighbors(r, c, self.rows, self.cols, self.variant)
+                nbs = get_nb(r, c, self.rows, self.cols, self.variant)
+                idx = r * self.cols + c
+                self.nbr_count[idx] = len(nbs)
+                for k, (nr, nc) in enumerate(nbs):
+                    self.nbr_r[idx, k] = nr
+                    self.nbr_c[idx, k] = nc
+
+    def _neighbors(self, r: int, c: int) -> List[Tuple[int, int]]:
+        """Get the neighbor list of a cell from the flat neighbor tables.
+
+        Args:
+            r: Row index
+            c: Column index
+
+        Returns:
+            List of (row, col) tuples for valid neighbors
+        """
+        idx = r * self.cols + c
+        count = self.nbr_count[idx]
+        return list(zip(self.nbr_r[idx, :count].tolist(), self.nbr_c[idx, :count].tolist()))
 
     def _precompute_parity(self):
         """Precompute odd/even parity matrix for OddEven variant."""
-        self.is_odd_matrix = [[VariantRules.is_odd_cell(r, c) for c in range(self.cols)] for r in range(self.rows)]
+        # Single broadcasted expression instead of a per-cell Python loop;
+        # (r + c) & 1 matches VariantRules.is_odd_cell.
+        r = np.arange(self.rows)[:, None]
+        c = np.arange(self.cols)[None, :]
+        self.is_odd_matrix = ((r + c) & 1).astype(bool)
+
+        # Per-cell neighbor weight signs (+1 odd neighbor, -1 even neighbor)
+        # depend only on geometry, so build them once instead of per solve()
+        self.nbr_weights = {}
+        for r in range(self.rows):
+            for c in range(self.cols):
+                self.nbr_weights[(r, c)] = [1 if self.is_odd_matrix[nr, nc] else -1 for nr, nc in self._neighbors(r, c)]
+
+    def update_board(self, board_state: List[List[int]], total_mines: Optional[int] = None):
+        """Point the solver at a new board state without rebuilding caches.
+
+        The precomputed neighbor tables, parity data and Z3 variables depend
+        only on (rows, cols, variant) and are kept across updates; only the
+        inputs consumed by solve() change.
+
+        Args:
+            board_state: 2D array-like of cell values (-2=flag, -1=unknown, 0-8=revealed count)
+            total_mines: Optional total number of mines in the grid
+        """
+        self.board_state = board_state
+        self.total_mines = total_mines
+
+    def _local_propagate(self) -> Tuple[set, set]:
+        """Run the two classic unit-propagation rules to fixed point in Python.
+
+        Rule 1: a revealed number with all its mines already accounted for
+        makes every remaining unknown neighbor safe. Rule 2: a revealed
+        number whose remaining unknown neighbors exactly cover the missing
+        mines makes them all mines. These locally decidable cases dominate
+        typical boards, so resolving them here lets solve() invoke Z3 only
+        on the leftover frontier (or not at all).
+
+        Only valid for variants whose numbers are plain neighbor-mine counts
+        (Standard, Knight, Cross); OddEven and Partition go straight to Z3.
+
+        Returns:
+            Tuple of (safe_cells, mine_cells) sets of (row, col) tuples
+
+        Raises:
+            ValueError: If a revealed number is locally contradictory
+        """
+        board = np.asarray(self.board_state, dtype=np.int8)
+        state, ok = _local_propagate_kernel(board, self.nbr_r, self.nbr_c, self.nbr_count, self.rows, self.cols)
+        if not ok:
+            raise ValueError("No solution for current constraints")
+
+        safe = {divmod(int(idx), self.cols) for idx in np.nonzero(state == 1)[0]}
+        mine = {divmod(int(idx), self.cols) for idx in np.nonzero(state == 2)[0]}
+        return safe, mine
+
+    @staticmethod
+    def _connected_components(undecided: List[Tuple[int, int]], numbered: list) -> list:
+        """Group undecided cells into independent constraint components.
+
+        Two undecided cells belong to the same component when some number
+        constraint mentions both. Cells mentioned by no constraint are
+        dropped: without a global mine total nothing can force them.
+
+        Args:
+            undecided: List of (row, col) undecided unknown cells
+            numbered: List of (touched, exprs) number constraints
+
+        Returns:
+            List of (cells, exprs) pairs, one per component
+        """
+        parent = {cell: cell for cell in undecided}
+
+        def find(x):
+            root = x
+            while parent[root] != root:
+                root = parent[root]
+            while parent[x] != root:
+                parent[x], x = root, parent[x]
+            return root
+
+        for touched, _ in numbered:
+            cells = iter(touched)
+            first = next(cells)
+            for other in cells:
+                root_a, root_b = find(first), find(other)
+                if root_a != root_b:
+                    parent[root_b] = root_a
+
+        comp_exprs = {}
+        for touched, exprs in numbered:
+            root = find(next(iter(touched)))
+            comp_exprs.setdefault(root, []).extend(exprs)
+
+        comp_cells = {}
+        for cell in undecided:
+            root = find(cell)
+            if root in comp_exprs:
+                comp_cells.setdefault(root, []).append(cell)
+
+        return [(cells, comp_exprs[root]) for root, cells in comp_cells.items()]
+
+    def _partition_group_count(self, r: int, c: int):
+        """Build the Z3 expression for the number of mine groups around a cell.
+
+        Args:
+            r: Row index
+            c: Column index
+
+        Returns:
+            Z3 integer expression counting contiguous mine groups in the ring
+        """
+        z3_vars = self.z3_vars
+
+        # 1. 定义顺时针方向的8个偏移量 (从左上角开始顺时针)
+        clockwise_offsets = [
+            (-1, -1),
+            (-1, 0),
+            (-1, 1),  # Top-Left, Top, Top-Right
+            (0, 1),  # Right
+            (1, 1),
+            (1, 0),
+            (1, -1),  # Bottom-Right, Bottom, Bottom-Left
+            (0, -1),  # Left
+        ]
+
+        # 2. 获取按顺时针排列的邻居变量列表
+        ring_vars = []
+        for dr, dc in clockwise_offsets:
+            nr, nc = r + dr, c + dc
+            # 边界检查：如果在网格内，取对应的Z3变量；如果在网格外，视为假 (非雷)
+            if 0 <= nr < self.rows and 0 <= nc < self.cols:
+                ring_vars.append(z3_vars[nr][nc])
+            else:
+                ring_vars.append(z3.BoolVal(False))  # 边界外视为安全，切断连通性
+
+        # 3. 统计 假 -> 真 的跳变次数 (一个新的雷组开始)
+        transitions = []
+        for i in range(8):
+            curr_v = ring_vars[i]
+            prev_v = ring_vars[(i - 1) % 8]  # 环状取前一个
+
+            # 如果 (前一个为假 且 当前为真)，则计数+1
+            # 使用 z3.If 将布尔结果转换为整数 1 或 0
+            transitions.append(z3.If(z3.And(z3.Not(prev_v), curr_v), 1, 0))
+
+        group_count = z3.Sum(transitions)
+
+        # 4. 特殊情况：如果8格全是雷，跳变次数为0，但应算作1组
+        # 注意：如果边界外有假值，这里永远为False，逻辑依然正确
+        is_full_ring = z3.And(ring_vars)
+
+        # 最终约束：如果是全环，值为1；否则为跳变次数
+        return z3.If(is_full_ring, 1, group_count)
+
+    def _build_oddeven_cell(self, r: int, c: int, val: int, nbs: List[Tuple[int, int]]) -> list:
+        """Build constraints for a revealed OddEven cell.
+
+        OddEven variant: number = |odd_neighbors_mines - even_neighbors_mines|.
+
+        Args:
+            r: Row index
+            c: Column index
+            val: Revealed number value
+            nbs: Neighbor list of the cell
+
+        Returns:
+            List of Z3 constraint expressions
+        """
+        z3_vars = self.z3_vars
+        weights = self.nbr_weights[(r, c)]
+        weighted_terms = [(z3_vars[nr][nc], w) for (nr, nc), w in zip(nbs, weights)]
+
+        # 加权和 (即：奇数雷数 - 偶数雷数) 等于 val 或者 -val
+        # (Pb constraints reject empty term lists, e.g. the
+        # center of a small Knight board, so degrade to the
+        # constant constraint val == 0 there)
+        if not weighted_terms:
+            return [z3.BoolVal(val == 0)]
+        if val == 0:
+            # |weighted_sum| == 0 collapses to one equality;
+            # no disjunction for the SAT layer to branch on
+            return [z3.PbEq(weighted_terms, 0)]
+        return [z3.Or(z3.PbEq(weighted_terms, val), z3.PbEq(weighted_terms, -val))]
+
+    def _build_partition_cell(self, r: int, c: int, val: int, nbs: List[Tuple[int, int]]) -> list:
+        """Build constraints for a revealed Partition cell.
+
+        Args:
+            r: Row index
+            c: Column index
+            val: Revealed number value
+            nbs: Neighbor list of the cell (unused; the ring is rebuilt clockwise)
+
+        Returns:
+            List of Z3 constraint expressions
+        """
+        return [self._partition_group_count(r, c) == val]
+
+    def _build_standard_cell(self, r: int, c: int, val: int, nbs: List[Tuple[int, int]]) -> list:
+        """Build constraints for a revealed Standard/Knight/Cross cell.
+
+        Args:
+            r: Row index
+            c: Column index
+            val: Revealed number value
+            nbs: Neighbor list of the cell
+
+        Returns:
+            List of Z3 constraint expressions
+        """
+        z3_vars = self.z3_vars
+        # Standard, Knight, Cross variants: number equals count of neighboring mines
+        if nbs:
+            return [z3.PbEq([(z3_vars[nr][nc], 1) for nr, nc in nbs], val)]
+        return [z3.BoolVal(val == 0)]
+
+    def _build_oddeven_bounds(self, r: int, c: int, nbs: List[Tuple[int, int]]) -> list:
+        """Build bound constraints for an unknown-number OddEven cell.
+
+        Args:
+            r: Row index
+            c: Column index
+            nbs: Neighbor list of the cell
+
+        Returns:
+            List of Z3 constraint expressions
+        """
+        z3_vars = self.z3_vars
+        # Use weighted sum: odd neighbors weight = 1, even neighbors weight = -1
+        weights = self.nbr_weights[(r, c)]
+        weighted_terms = [(z3_vars[nr][nc], w) for (nr, nc), w in zip(nbs, weights)]
+
+        # Constraint: weighted sum is between -8 and 8
+        if not weighted_terms:
+            return []
+        return [z3.PbGe(weighted_terms, -8), z3.PbLe(weighted_terms, 8)]
+
+    def _build_partition_bounds(self, r: int, c: int, nbs: List[Tuple[int, int]]) -> list:
+        """Build bound constraints for an unknown-number Partition cell.
+
+        Args:
+            r: Row index
+            c: Column index
+            nbs: Neighbor list of the cell (unused; the ring is rebuilt clockwise)
+
+        Returns:
+            List of Z3 constraint expressions
+        """
+        final_count = self._partition_group_count(r, c)
+
+        # 约束：对于未知数字，只要满足基本的 Partition 规则即可 (0到4组是物理极限，但约束0-8也行)
+        return [final_count >= 0, final_count <= 8]
+
+    def _build_standard_bounds(self, r: int, c: int, nbs: List[Tuple[int, int]]) -> list:
+        """Build bound constraints for an unknown-number Standard/Knight/Cross cell.
+
+        Args:
+            r: Row index
+            c: Column index
+            nbs: Neighbor list of the cell
+
+        Returns:
+            List of Z3 constraint expressions
+        """
+        z3_vars = self.z3_vars
+        # Standard variants: number of neighboring mines is between 0 and 8
+        counted_terms = [(z3_vars[nr][nc], 1) for nr, nc in nbs]
+        if not counted_terms:
+            return []
+        return [z3.PbGe(counted_terms, 0), z3.PbLe(counted_terms, 8)]
+
+    def _deduce(self, solver: z3.Solver, cells: List[Tuple[int, int]], safe_cells: list, mine_cells: list):
+        """Classify cells as forced-safe or forced-mine via assumption checks.
+
+        A cell is a forced mine iff no model assigns it empty, and forced
+        safe iff no model assigns it a mine. Every satisfiable check hands
+        back a model for free, so the values all candidate cells take in
+        observed models are recorded and any check that an existing model
+        already refutes is skipped -- a cell seen empty in some model can
+        never be a forced mine, and vice versa.
+
+        Args:
+            solver: Solver holding the constraints for these cells
+            cells: Candidate (row, col) cells to classify
+            safe_cells: Output list extended with forced-safe cells
+            mine_cells: Output list extended with forced-mine cells
+
+        Raises:
+            ValueError: If the solver's constraints are unsatisfiable
+        """
+        z3_vars = self.z3_vars
+        seen_empty = set()
+        seen_mine = set()
+
+        def record(model):
+            for cell in cells:
+                v = model[z3_vars[cell[0]][cell[1]]]
+                if v is None:
+                    # Unconstrained in this solver: can take either value
+                    seen_empty.add(cell)
+                    seen_mine.add(cell)
+                elif z3.is_true(v):
+                    seen_mine.add(cell)
+                else:
+                    seen_empty.add(cell)
+
+        if solver.check() == z3.unsat:
+            raise ValueError("No solution for current constraints")
+        record(solver.model())
+
+        for cell in cells:
+            r, c = cell
+            if cell not in seen_empty:
+                # Test if cell must be a mine (cannot be empty)
+                if solver.check(z3.Not(z3_vars[r][c])) == z3.unsat:
+                    mine_cells.append(cell)
+                    continue
+                record(solver.model())
+            if cell not in seen_mine:
+                # Test if cell must be empty (cannot be a mine)
+                if solver.check(z3_vars[r][c]) == z3.unsat:
+                    safe_cells.append(cell)
+                else:
+                    record(solver.model())
 
     def solve(self) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
         """Solve the current board state.
@@ -76,176 +567,150 @@ class MinesweeperSolver:
         Raises:
             ValueError: If no solution exists for the current constraints
         """
-        # Create Z3 variables for each cell (0=empty, 1=mine)
-        z3_vars = [[z3.Int(f"c_{r}_{c}") for c in range(self.cols)] for r in range(self.rows)]
-        solver = z3.Solver()
+        # Trivial boards skip constraint building entirely: a fully
+        # unknown board without a mine total carries no information, and a
+        # board with no unknown cells has nothing left to classify (the
+        # existing no-unknowns path below returns empty results either way)
+        board = np.asarray(self.board_state, dtype=np.int8)
+        informative = int(np.count_nonzero(board != CELL_UNKNOWN))
+        if informative == 0 and self.total_mines is None:
+            return [], []
+        if informative == board.size:
+            return [], []
 
-        # Constraint: each cell is either 0 (empty) or 1 (mine)
-        for r in range(self.rows):
-            for c in range(self.cols):
-                solver.add(z3.And(z3_vars[r][c] >= 0, z3_vars[r][c] <= 1))
+        # Resolve locally forced cells with pure-Python unit propagation
+        # first; on easy boards this decides everything and Z3 is skipped
+        if self.variant in (VARIANT_ODD_EVEN, VARIANT_PARTITION):
+            local_safe, local_mine = set(), set()
+        else:
+            local_safe, local_mine = self._local_propagate()
+
+        # Z3 Bool variables for each cell (False=empty, True=mine),
+        # precomputed per instance. Booleans keep the problem inside Z3's
+        # SAT/pseudo-boolean engine with no per-cell domain assertions,
+        # where the old Int encoding needed And(v >= 0, v <= 1) per cell
+        # and dragged in the arithmetic theory.
+        z3_vars = self.z3_vars
+        solver = self._solver
+
+        # Accumulate constraints in Python lists and assert them in bulk
+        # solver.add calls, instead of one Python/C crossing per assertion.
+        # Single-literal pins (revealed/flagged cells and local deductions)
+        # are kept separate because every per-component sub-solver below
+        # needs them too.
+        pins = []
+        constraints = []
+
+        # Number constraints recorded as (touched, exprs), where touched is
+        # the set of still-undecided unknown cells the constraint mentions;
+        # used below to split the deduction into independent components
+        numbered = []
 
         unknown_cells = []
 
         # Add constraints based on current board state
         for r in range(self.rows):
             for c in range(self.cols):
-                val = self.board_state[r][c]
+                # board_state may be a NumPy int8 array; unbox once so the
+                # cache keys and Pb constraint bounds stay plain Python ints
+                val = int(self.board_state[r][c])
 
                 if val >= 0:  # Revealed cell with number
-                    solver.add(z3_vars[r][c] == 0)  # Revealed cells cannot be mines
-                    nbs = self.neighbor_cache[(r, c)]
-
-                    if self.variant == VARIANT_ODD_EVEN:
-                        # OddEven variant: number = |odd_neighbors_mines - even_neighbors_mines|
-                        weighted_terms = []
-                        for nr, nc in nbs:
-                            weight = 1 if self.is_odd_matrix[nr][nc] else -1
-                            weighted_terms.append(z3_vars[nr][nc] * weight)
-
-                        # 计算加权和 (即：奇数雷数 - 偶数雷数)
-                        # 绝对值约束：weighted_sum 等于 val 或者 -val
-                        weighted_sum = z3.Sum(weighted_terms)
-                        solver.add(z3.Or(weighted_sum == val, weighted_sum == -val))
-                    elif self.variant == VARIANT_PARTITION:
-                        # 1. 定义顺时针方向的8个偏移量 (从左上角开始顺时针)
-                        clockwise_offsets = [
-                            (-1, -1),
-                            (-1, 0),
-                            (-1, 1),  # Top-Left, Top, Top-Right
-                            (0, 1),  # Right
-                            (1, 1),
-                            (1, 0),
-                            (1, -1),  # Bottom-Right, Bottom, Bottom-Left
-                            (0, -1),  # Left
-                        ]
-
-                        # 2. 获取按顺时针排列的邻居变量列表
-                        ring_vars = []
-                        for dr, dc in clockwise_offsets:
-                            nr, nc = r + dr, c + dc
-                            # 边界检查：如果在网格内，取对应的Z3变量；如果在网格外，视为0 (非雷)
-                            if 0 <= nr < self.rows and 0 <= nc < self.cols:
-                                ring_vars.append(z3_vars[nr][nc])
-                            else:
-                                ring_vars.append(0)  # 边界外视为安全，切断连通性
-
-                        # 3. 统计 0 -> 1 的跳变次数 (一个新的雷组开始)
-                        transitions = []
-                        for i in range(8):
-                            curr_v = ring_vars[i]
-                            prev_v = ring_vars[(i - 1) % 8]  # 环状取前一个
-
-                            # 如果 (前一个==0 且 当前==1)，则计数+1
-                            # 使用 z3.If 将布尔结果转换为整数 1 或 0
-                            transitions.append(z3.If(z3.And(prev_v == 0, curr_v == 1), 1, 0))
-
-                        group_count = z3.Sum(transitions)
-
-                        # 4. 特殊情况：如果8格全是雷，跳变次数为0，但应算作1组
-                        # 检查是否所有变量都为1
-                        # 注意：如果边界外有0，这里永远为False，逻辑依然正确
-                        is_full_ring = z3.And([v == 1 for v in ring_vars if isinstance(v, z3.ArithRef)])
-                        # (注：边界外的 0 是 int 类型，isinstance 用于过滤或直接比较即可，上面写法简化版如下)
-
-                        # 更严谨的 Z3 写法：
-                        is_full_ring = z3.And([v == 1 for v in ring_vars])
-
-                        # 最终约束：如果是全环，值为1；否则为跳变次数
-                        final_count = z3.If(is_full_ring, 1, group_count)
-
-                        solver.add(final_count == val)
-                    else:
-                        # Standard, Knight, OddEven variants: number equals count of neighboring mines
-                        neighbor_mines = z3.Sum([z3_vars[nr][nc] for nr, nc in nbs])
-                        solver.add(neighbor_mines == val)
+                    pins.append(z3.Not(z3_vars[r][c]))  # Revealed cells cannot be mines
+                    nbs = self._neighbors(r, c)
+                    exprs = self._assert_cache.get((r, c, val))
+                    if exprs is None:
+                        exprs = self._build_cell_exprs(r, c, val, nbs)
+                        self._assert_cache[(r, c, val)] = exprs
+                    constraints.extend(exprs)
+                    touched = frozenset(
+                        (nr, nc)
+                        for nr, nc in nbs
+                        if self.board_state[nr][nc] == CELL_UNKNOWN and (nr, nc) not in local_safe and (nr, nc) not in local_mine
+                    )
+                    if touched:
+                        numbered.append((touched, exprs))
                 elif val == CELL_UNKNOWN_NUMBER:
                     # Cell is a number (0-8) but exact value unknown
-                    solver.add(z3_vars[r][c] == 0)  # Not a mine
-                    nbs = self.neighbor_cache[(r, c)]
-
-                    if self.variant == VARIANT_ODD_EVEN:
-                        # OddEven variant: number = |odd_neighbors_mines - even_neighbors_mines|
-                        # Use weighted sum: odd neighbors weight = 1, even neighbors weight = -1
-                        weighted_terms = []
-                        for nr, nc in nbs:
-                            weight = 1 if self.is_odd_matrix[nr][nc] else -1
-                            weighted_terms.append(z3_vars[nr][nc] * weight)
-
-                        # Constraint: weighted_sum is between -8 and 8
-                        weighted_sum = z3.Sum(weighted_terms)
-                        solver.add(weighted_sum >= -8)
-                        solver.add(weighted_sum <= 8)
-                    elif self.variant == VARIANT_PARTITION:
-                        clockwise_offsets = [
-                            (-1, -1),
-                            (-1, 0),
-                            (-1, 1),
-                            (0, 1),
-                            (1, 1),
-                            (1, 0),
-                            (1, -1),
-                            (0, -1),
-                        ]
-                        ring_vars = []
-                        for dr, dc in clockwise_offsets:
-                            nr, nc = r + dr, c + dc
-                            if 0 <= nr < self.rows and 0 <= nc < self.cols:
-                                ring_vars.append(z3_vars[nr][nc])
-                            else:
-                                ring_vars.append(0)
-
-                        transitions = []
-                        for i in range(8):
-                            curr_v = ring_vars[i]
-                            prev_v = ring_vars[(i - 1) % 8]
-                            transitions.append(z3.If(z3.And(prev_v == 0, curr_v == 1), 1, 0))
-
-                        group_count = z3.Sum(transitions)
-                        is_full_ring = z3.And([v == 1 for v in ring_vars])
-                        final_count = z3.If(is_full_ring, 1, group_count)
-
-                        # 约束：对于未知数字，只要满足基本的 Partition 规则即可 (0到4组是物理极限，但约束0-8也行)
-                        solver.add(final_count >= 0)
-                        solver.add(final_count <= 8)
-                    else:
-                        # Standard variants: number of neighboring mines is between 0 and 8
-                        neighbor_mines = z3.Sum([z3_vars[nr][nc] for nr, nc in nbs])
-                        solver.add(neighbor_mines >= 0)
-                        solver.add(neighbor_mines <= 8)
+                    pins.append(z3.Not(z3_vars[r][c]))  # Not a mine
+                    nbs = self._neighbors(r, c)
+                    exprs = self._assert_cache.get((r, c, val))
+                    if exprs is None:
+                        exprs = self._build_unknown_exprs(r, c, nbs)
+                        self._assert_cache[(r, c, val)] = exprs
+                    constraints.extend(exprs)
+                    touched = frozenset(
+                        (nr, nc)
+                        for nr, nc in nbs
+                        if self.board_state[nr][nc] == CELL_UNKNOWN and (nr, nc) not in local_safe and (nr, nc) not in local_mine
+                    )
+                    if touched:
+                        numbered.append((touched, exprs))
                 elif val == CELL_UNKNOWN:
                     unknown_cells.append((r, c))
                 elif val == CELL_FLAG:
-                    solver.add(z3_vars[r][c] == 1)  # Flagged cells are mines
+                    pins.append(z3_vars[r][c])  # Flagged cells are mines
 
         # Optional: total mines constraint
         if self.total_mines is not None:
-            solver.add(z3.Sum([z3_vars[r][c] for r in range(self.rows) for c in range(self.cols)]) == self.total_mines)
+            constraints.append(z3.PbEq([(z3_vars[r][c], 1) for r in range(self.rows) for c in range(self.cols)], self.total_mines))
 
         if not unknown_cells:
             return [], []
 
-        # Check if solution exists
-        if solver.check() == z3.unsat:
-            raise ValueError("No solution for current constraints")
-
-        # Find safe cells and mine cells
-        safe_cells = []
-        mine_cells = []
-
-        for r, c in unknown_cells:
-            # Test if cell must be a mine (cannot be empty)
-            solver.push()
-            solver.add(z3_vars[r][c] == 0)
-            if solver.check() == z3.unsat:
-                mine_cells.append((r, c))
-            solver.pop()
-
-            # Test if cell must be empty (cannot be a mine)
-            solver.push()
-            solver.add(z3_vars[r][c] == 1)
+        # Collect locally deduced cells (in board order) and pin them as
+        # constraints so the SAT phase only works on the leftover frontier
+        safe_cells = [cell for cell in unknown_cells if cell in local_safe]
+        mine_cells = [cell for cell in unknown_cells if cell in local_mine]
+        undecided = [cell for cell in unknown_cells if cell not in local_safe and cell not in local_mine]
+        for r, c in safe_cells:
+            pins.append(z3.Not(z3_vars[r][c]))
+        for r, c in mine_cells:
+            pins.append(z3_vars[r][c])
+
+        if not undecided:
+            # Everything was decided by unit propagation; the fixed-point
+            # pass already verified every revealed number exactly, so only
+            # the optional global mine total still needs checking
+            if self.total_mines is not None:
+                flags = sum(1 for r in range(self.rows) for c in range(self.cols) if self.board_state[r][c] == CELL_FLAG)
+                if flags + len(mine_cells) != self.total_mines:
+                    raise ValueError("No solution for current constraints")
+            return safe_cells, mine_cells
+
+        # Assert the current board state inside a single push/pop frame on
+        # the persistent solver, so the solver object survives across
+        # solves while its assertion stack ends each call where it started
+        solver.push()
+        try:
+            solver.add(pins)
+            solver.add(constraints)
+
+            # Check if solution exists (over the full constraint system)
             if solver.check() == z3.unsat:
-                safe_cells.append((r, c))
+                raise ValueError("No solution for current constraints")
+
+            # Find safe cells and mine cells using assumption-based checks
+            # (see _deduce); check(assumption) keeps learned clauses across
+            # calls, unlike per-cell push/add/check/pop which discards them
+            # on every pop.
+            if self.total_mines is not None:
+                # The global mine total couples every constraint, so deduce
+                # against the single full solver
+                self._deduce(solver, undecided, safe_cells, mine_cells)
+            else:
+                # Without a global constraint the board decomposes into
+                # independent components: cells only interact when some number
+                # constraint mentions both. The deduction checks (the expensive
+                # part, two per cell) then run on small per-component solvers
+                # instead of the monolithic formula.
+                for cells, exprs in self._connected_components(undecided, numbered):
+                    sub = _make_solver()
+                    sub.add(pins)
+                    sub.add(exprs)
+                    self._deduce(sub, cells, safe_cells, mine_cells)
+        finally:
             solver.pop()
-
+        safe_cells.sort()
+        mine_cells.sort()
         return safe_cells, mine_cells
@@ -10,83 +10,85 @@ from .constants import (
     VARIANT_PARTITION,
 )
 
+# Neighbor offset tables precomputed per variant so get_neighbors does a
+# single dict lookup instead of rebuilding offset lists and walking an
+# if/elif chain on every call.
+_STANDARD_OFFSETS = (
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+)
+_KNIGHT_OFFSETS = (
+    (-2, -1),
+    (-2, 1),
+    (-1, -2),
+    (-1, 2),
+    (1, -2),
+    (1, 2),
+    (2, -1),
+    (2, 1),
+)
+_CROSS_OFFSETS = (
+    (-2, 0),
+    (-1, 0),
+    (1, 0),
+    (2, 0),
+    (0, -2),
+    (0, -1),
+    (0, 1),
+    (0, 2),
+)
+_OFFSETS = {
+    VARIANT_STANDARD: _STANDARD_OFFSETS,
+    VARIANT_KNIGHT: _KNIGHT_OFFSETS,
+    VARIANT_ODD_EVEN: _STANDARD_OFFSETS,
+    VARIANT_CROSS: _CROSS_OFFSETS,
+    VARIANT_PARTITION: _STANDARD_OFFSETS,
+}
 
-class VariantRules:
-    """Static class for calculating neighbors based on different rule variants."""
 
-    @staticmethod
-    def is_odd_cell(r: int, c: int) -> bool:
-        """Check if a cell is on an odd position (using checkerboard pattern).
+def is_odd_cell(r: int, c: int) -> bool:
+    """Check if a cell is on an odd position (using checkerboard pattern).
 
-        Args:
-            r: Row index
-            c: Column index
+    Args:
+        r: Row index
+        c: Column index
 
-        Returns:
-            True if the cell is odd, False if even
-        """
-        return (r + c) % 2 == 1
+    Returns:
+        True if the cell is odd, False if even
+    """
+    return (r + c) % 2 == 1
 
-    @staticmethod
-    def get_neighbors(r: int, c: int, rows: int, cols: int, variant_type: str = VARIANT_STANDARD) -> List[Tuple[int, int]]:
-        """Get neighbors of a cell based on the variant type.
 
-        Args:
-            r: Row index
-            c: Column index
-            rows: Total rows in the grid
-            cols: Total columns in the grid
-            variant_type: Type of variant ("Standard", "Knight", "OddEven", "Cross", or "Partition")
+def get_neighbors(r: int, c: int, rows: int, cols: int, variant_type: str = VARIANT_STANDARD) -> List[Tuple[int, int]]:
+    """Get neighbors of a cell based on the variant type.
 
-        Returns:
-            List of (row, col) tuples for valid neighbors
-        """
-        standard_offsets = [
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-            (0, -1),
-            (0, 1),
-            (1, -1),
-            (1, 0),
-            (1, 1),
-        ]
-        knight_offsets = [
-            (-2, -1),
-            (-2, 1),
-            (-1, -2),
-            (-1, 2),
-            (1, -2),
-            (1, 2),
-            (2, -1),
-            (2, 1),
-        ]
+    Args:
+        r: Row index
+        c: Column index
+        rows: Total rows in the grid
+        cols: Total columns in the grid
+        variant_type: Type of variant ("Standard", "Knight", "OddEven", "Cross", or "Partition")
+
+    Returns:
+        List of (row, col) tuples for valid neighbors
+    """
+    offsets = _OFFSETS.get(variant_type, _STANDARD_OFFSETS)
+    return [(r + dr, c + dc) for dr, dc in offsets if 0 <= r + dr < rows and 0 <= c + dc < cols]
+
+
+class VariantRules:
+    """Backward-compatible facade over the module-level rule functions.
 
-        if variant_type == VARIANT_STANDARD:
-            offsets = standard_offsets
-        elif variant_type == VARIANT_KNIGHT:
-            offsets = knight_offsets
-        elif variant_type == VARIANT_ODD_EVEN:
-            offsets = standard_offsets
-        elif variant_type == VARIANT_CROSS:
-            offsets = [
-                (-2, 0),
-                (-1, 0),
-                (1, 0),
-                (2, 0),
-                (0, -2),
-                (0, -1),
-                (0, 1),
-                (0, 2),
-            ]
-        elif variant_type == VARIANT_PARTITION:
-            offsets = standard_offsets
-        else:
-            offsets = standard_offsets
+    Kept as thin staticmethod wrappers; callers on a hot path should bind
+    the free functions directly to skip the class attribute lookup and
+    descriptor dispatch per call.
+    """
 
-        neighbors = []
-        for dr, dc in offsets:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < rows and 0 <= nc < cols:
-                neighbors.append((nr, nc))
-        return neighbors
+    is_odd_cell = staticmethod(is_odd_cell)
+    get_neighbors = staticmethod(get_neighbors)
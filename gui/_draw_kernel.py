@@ -0,0 +1,53 @@
+"""Compiled-friendly kernels for grid rendering."""
+
+import numpy as np
+
+from core.constants import CELL_UNKNOWN, CELL_UNKNOWN_NUMBER
+
+try:
+    from numba import njit
+except ImportError:  # Numba is an optional accelerator
+    njit = None
+
+# Background color indices produced by compute_bg_indices; the view maps
+# them to actual colors
+BG_UNKNOWN = 0
+BG_REVEALED = 1
+BG_SAFE = 2
+BG_MINE = 3
+
+
+def compute_bg_indices(board, safe_mask, mine_mask):
+    """Compute the background color index for every cell in one pass.
+
+    Plain numeric loops over the int8 board and boolean highlight masks,
+    so the function can be JIT-compiled by Numba when it is installed;
+    the pure-Python version is used otherwise.
+
+    Args:
+        board: int8 array of cell values, shape (rows, cols)
+        safe_mask: bool array of solver-safe highlighted cells
+        mine_mask: bool array of solver-mine highlighted cells
+
+    Returns:
+        uint8 array of BG_* color indices, shape (rows, cols)
+    """
+    rows, cols = board.shape
+    out = np.empty((rows, cols), dtype=np.uint8)
+    for r in range(rows):
+        for c in range(cols):
+            val = board[r, c]
+            highlightable = val == CELL_UNKNOWN or val == CELL_UNKNOWN_NUMBER
+            if safe_mask[r, c] and highlightable:
+                out[r, c] = BG_SAFE
+            elif mine_mask[r, c] and highlightable:
+                out[r, c] = BG_MINE
+            elif val >= 0:
+                out[r, c] = BG_REVEALED
+            else:
+                out[r, c] = BG_UNKNOWN
+    return out
+
+
+if njit is not None:
+    compute_bg_indices = njit(cache=True)(compute_bg_indices)
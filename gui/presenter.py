@@ -16,6 +16,11 @@ class MinesweeperPresenter:
         self.game_state = game_state
         self.view = view
 
+        # Persistent solver reused across solve clicks; rebuilt only when
+        # the grid shape or variant changes (see _get_solver)
+        self._solver = None
+        self._solver_key = None
+
     def on_cell_click(self, row, col, button):
         """Handle cell click event.
 
@@ -31,17 +36,34 @@ class MinesweeperPresenter:
 
         self.view.update_display()
 
-    def on_solve_click(self):
-        """Handle solve button click."""
-        try:
-            solver = MinesweeperSolver(
+    def _get_solver(self):
+        """Get the persistent solver for the current game configuration.
+
+        Consecutive solves usually share grid shape and variant, so the
+        solver instance (and its precomputed neighbor/variable caches) is
+        kept across clicks and only refreshed with the new board state.
+
+        Returns:
+            MinesweeperSolver instance for the current configuration
+        """
+        key = (self.game_state.rows, self.game_state.cols, self.game_state.variant)
+        if self._solver is None or key != self._solver_key:
+            self._solver = MinesweeperSolver(
                 self.game_state.rows,
                 self.game_state.cols,
                 self.game_state.board_state,
                 self.game_state.variant,
                 total_mines=self.game_state.total_mines,
             )
-            safe, mines = solver.solve()
+            self._solver_key = key
+        else:
+            self._solver.update_board(self.game_state.board_state, total_mines=self.game_state.total_mines)
+        return self._solver
+
+    def on_solve_click(self):
+        """Handle solve button click."""
+        try:
+            safe, mines = self._get_solver().solve()
 
             if not safe and not mines:
                 self.view.show_status("No certain cells found")
@@ -144,10 +166,34 @@ class MinesweeperPresenter:
         """Get current board state.
 
         Returns:
-            2D list of cell values
+            2D int8 ndarray of cell values
         """
         return self.game_state.board_state
 
+    def get_state_version(self):
+        """Get the monotonic state version counter.
+
+        Returns:
+            Integer incremented on every board/highlight mutation
+        """
+        return self.game_state.state_version
+
+    def get_safe_highlights(self):
+        """Get the set of cells highlighted as safe.
+
+        Returns:
+            Set of (row, col) tuples highlighted as safe by the solver
+        """
+        return self.game_state.safe_highlights
+
+    def get_mine_highlights(self):
+        """Get the set of cells highlighted as mines.
+
+        Returns:
+            Set of (row, col) tuples highlighted as mines by the solver
+        """
+        return self.game_state.mine_highlights
+
     def is_cell_safe_highlight(self, row, col):
         """Check if cell is highlighted as safe.
 
@@ -1,5 +1,7 @@
 """PyQt6 GUI for Minesweeper solver (View layer in MVP)."""
 
+import numpy as np
+
 from PyQt6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -10,11 +12,10 @@ from PyQt6.QtWidgets import (
     QSpinBox,
     QLabel,
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QColor, QPen
+from PyQt6.QtCore import Qt, QTimer, QEvent
+from PyQt6.QtGui import QFont, QColor, QPen, QPixmap, QPainter
 
 from core.constants import (
-    CELL_UNKNOWN,
     CELL_FLAG,
     CELL_UNKNOWN_NUMBER,
     VARIANT_STANDARD,
@@ -32,6 +33,13 @@ from gui.constants import (
     COLOR_BACKGROUND,
     NUMBER_COLORS,
 )
+from gui._draw_kernel import BG_UNKNOWN, BG_REVEALED, BG_SAFE, BG_MINE, compute_bg_indices
+
+# Qt mouse buttons mapped to the presenter's button codes (1=left, 3=right)
+_BUTTON_MAP = {
+    Qt.MouseButton.LeftButton: 1,
+    Qt.MouseButton.RightButton: 3,
+}
 
 
 class GridWidget(QWidget):
@@ -42,9 +50,128 @@ class GridWidget(QWidget):
         self.presenter = None
         self.cell_size = 36
         self.setMinimumSize(200, 200)
-        self.setMouseTracking(True)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
+        # paintEvent covers the whole widget with the grid pixmap, so Qt
+        # does not need to erase the backing store before each repaint
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+        # Paint resources built once instead of per cell per paint:
+        # QColor/QPen/QFont construction is cheap individually but adds up
+        # at rows*cols objects for every repaint
+        self._bg_safe = QColor(*COLOR_SAFE_HIGHLIGHT)
+        self._bg_mine = QColor(*COLOR_MINE_HIGHLIGHT)
+        self._bg_revealed = QColor(*COLOR_REVEALED)
+        self._bg_unknown = QColor(*COLOR_UNKNOWN)
+        self._bg_widget = QColor(*COLOR_BACKGROUND)
+        self._border_pen = QPen(QColor(*COLOR_GRID_BORDER), 1)
+        self._text_default = QColor(20, 20, 20)
+        self._text_flag = QColor(200, 0, 0)
+        self._text_unknown_number = QColor(100, 100, 100)
+        self._number_colors = {value: QColor(*rgb) for value, rgb in NUMBER_COLORS.items()}
+        self._font_cache = {}
+
+        # Background colors indexed by the BG_* indices the draw kernel emits
+        self._bg_by_index = [None] * 4
+        self._bg_by_index[BG_UNKNOWN] = self._bg_unknown
+        self._bg_by_index[BG_REVEALED] = self._bg_revealed
+        self._bg_by_index[BG_SAFE] = self._bg_safe
+        self._bg_by_index[BG_MINE] = self._bg_mine
+
+        # Pre-rendered cell tiles (background fill plus border) keyed by
+        # (BG_* index, cell size); a cell paints as one pixmap blit
+        self._tile_cache = {}
+
+        # Pre-rendered cell glyphs ("0".."8", "F", "?") keyed by
+        # (text, cell size); the text color is a fixed function of the
+        # glyph, so it is baked into the pixmap
+        self._glyph_cache = {}
+
+        # The grid is rendered into an offscreen pixmap that is only
+        # rebuilt when the board changes (see invalidate); expose-type
+        # repaints just blit the cached pixmap
+        self._grid_pixmap = None
+        self._grid_dirty = True
+
+        # Memoised grid layout (see _grid_layout)
+        self._layout_key = None
+        self._layout = None
+
+        # Version of the game state at the last render: invalidations
+        # that did not actually change anything (e.g. a solve finding no
+        # new cells) are detected with one integer compare and skip the
+        # re-render
+        self._rendered_version = None
+
+    def _cell_tile(self, bg_index, cell_size):
+        """Get the cached pre-rendered tile for a cell state and size.
+
+        Args:
+            bg_index: BG_* color index from the draw kernel
+            cell_size: Cell size in pixels
+
+        Returns:
+            QPixmap of the filled, bordered cell tile
+        """
+        key = (bg_index, cell_size)
+        tile = self._tile_cache.get(key)
+        if tile is None:
+            tile = QPixmap(cell_size, cell_size)
+            painter = QPainter(tile)
+            painter.fillRect(0, 0, cell_size, cell_size, self._bg_by_index[bg_index])
+            painter.setPen(self._border_pen)
+            painter.drawRect(0, 0, cell_size - 1, cell_size - 1)
+            painter.end()
+            self._tile_cache[key] = tile
+        return tile
+
+    def _cell_glyph(self, text, color, cell_size):
+        """Get the cached pre-rendered glyph pixmap for cell text.
+
+        Args:
+            text: Cell text ("0".."8", "F", or "?")
+            color: Text color for the glyph
+            cell_size: Cell size in pixels
+
+        Returns:
+            QPixmap with the centered glyph on a transparent background
+        """
+        key = (text, cell_size)
+        glyph = self._glyph_cache.get(key)
+        if glyph is None:
+            glyph = QPixmap(cell_size, cell_size)
+            glyph.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(glyph)
+            painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+            painter.setFont(self._cell_font(max(10, int(cell_size * 0.5))))
+            painter.setPen(color)
+            painter.drawText(0, 0, cell_size, cell_size, Qt.AlignmentFlag.AlignCenter, text)
+            painter.end()
+            self._glyph_cache[key] = glyph
+        return glyph
+
+    def invalidate(self):
+        """Mark the cached grid pixmap stale and schedule a repaint."""
+        self._grid_dirty = True
+        self.update()
+
+    def _cell_font(self, point_size):
+        """Get the cached bold cell font for a point size.
+
+        Args:
+            point_size: Font point size
+
+        Returns:
+            QFont instance shared across paints
+        """
+        font = self._font_cache.get(point_size)
+        if font is None:
+            font = QFont()
+            font.setPointSize(point_size)
+            font.setBold(True)
+            self._font_cache[point_size] = font
+        return font
+
     def set_presenter(self, presenter):
         """Set the presenter for this grid."""
         self.presenter = presenter
@@ -66,41 +193,96 @@ class GridWidget(QWidget):
         cell_size = min(cell_width, cell_height)
         return max(20, min(80, int(cell_size)))
 
-    def _grid_origin(self):
-        """Calculate grid origin for centering."""
-        if not self.presenter:
-            return (0, 0)
+    def _grid_layout(self):
+        """Get the cell size and centered grid origin, memoised per geometry.
+
+        The layout only depends on the widget size and grid shape, so it is
+        recomputed when that key changes and shared by the render and mouse
+        paths otherwise.
 
+        Returns:
+            Tuple of (cell_size, origin_x, origin_y, rows, cols)
+        """
         cols = self.presenter.get_cols()
         rows = self.presenter.get_rows()
-        cell_size = self._calculate_cell_size()
-
-        grid_width = cols * cell_size
-        grid_height = rows * cell_size
-
-        grid_x = (self.width() - grid_width) // 2
-        grid_y = (self.height() - grid_height) // 2
-
-        return (grid_x, grid_y)
+        key = (self.width(), self.height(), rows, cols)
+        if key != self._layout_key:
+            cell_size = self._calculate_cell_size()
+            origin_x = (self.width() - cols * cell_size) // 2
+            origin_y = (self.height() - rows * cell_size) // 2
+            self._layout = (cell_size, origin_x, origin_y, rows, cols)
+            self._layout_key = key
+        return self._layout
 
     def paintEvent(self, event):
-        """Draw the grid."""
-        from PyQt6.QtGui import QPainter
+        """Blit the cached grid pixmap, re-rendering it if stale."""
+        if self._grid_dirty or self._grid_pixmap is None or self._grid_pixmap.size() != self.size():
+            if self._grid_changed():
+                self._render_grid()
+            self._grid_dirty = False
 
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self._grid_pixmap)
+
+    def _grid_changed(self):
+        """Check whether the game state differs from the last render.
+
+        Returns:
+            True if the cached pixmap no longer matches the current state
+        """
+        if self._grid_pixmap is None or self._grid_pixmap.size() != self.size():
+            return True
+        if not self.presenter:
+            return self._rendered_version is not None
+        return self._rendered_version != self.presenter.get_state_version()
+
+    def resizeEvent(self, event):
+        """Invalidate the cached pixmap when the widget is resized."""
+        self._grid_dirty = True
+        super().resizeEvent(event)
+
+    def _render_grid(self):
+        """Render the full grid into the offscreen pixmap."""
+        if self._grid_pixmap is None or self._grid_pixmap.size() != self.size():
+            self._grid_pixmap = QPixmap(self.size())
+
+        painter = QPainter(self._grid_pixmap)
+        # Everything here is axis-aligned rects and pixmap blits, which the
+        # raster engine handles on its fast path; full antialiasing would
+        # force the slow coverage path for no visual gain. Text keeps its
+        # own antialiasing.
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
 
         # Fill background
-        painter.fillRect(self.rect(), QColor(*COLOR_BACKGROUND))
+        painter.fillRect(self._grid_pixmap.rect(), self._bg_widget)
 
         if not self.presenter:
+            painter.end()
             return
 
-        origin_x, origin_y = self._grid_origin()
+        # Fetch everything the loop needs once per render: the highlight
+        # sets replace two presenter round-trips per cell, and the painter
+        # methods are bound to locals for the rows*cols iterations
+        cell_size, origin_x, origin_y, rows, cols = self._grid_layout()
         board_state = self.presenter.get_board_state()
-        rows = self.presenter.get_rows()
-        cols = self.presenter.get_cols()
-        cell_size = self._calculate_cell_size()
+        safe_highlights = self.presenter.get_safe_highlights()
+        mine_highlights = self.presenter.get_mine_highlights()
+        draw_pixmap = painter.drawPixmap
+
+        # Resolve every cell's background color index in one kernel call
+        # (compiled by Numba when available) instead of three Python
+        # conditionals per cell in the paint loop
+        board = np.asarray(board_state, dtype=np.int8)
+        safe_mask = np.zeros((rows, cols), dtype=np.bool_)
+        mine_mask = np.zeros((rows, cols), dtype=np.bool_)
+        for hr, hc in safe_highlights:
+            if hr < rows and hc < cols:
+                safe_mask[hr, hc] = True
+        for hr, hc in mine_highlights:
+            if hr < rows and hc < cols:
+                mine_mask[hr, hc] = True
+        bg_indices = compute_bg_indices(board, safe_mask, mine_mask)
+        tiles = [self._cell_tile(index, cell_size) for index in range(len(self._bg_by_index))]
 
         # Draw cells
         for r in range(rows):
@@ -110,79 +292,61 @@ class GridWidget(QWidget):
 
                 val = board_state[r][c]
 
-                # Determine background color
-                if self.presenter.is_cell_safe_highlight(r, c) and (val == CELL_UNKNOWN or val == CELL_UNKNOWN_NUMBER):
-                    bg_color = QColor(*COLOR_SAFE_HIGHLIGHT)
-                elif self.presenter.is_cell_mine_highlight(r, c) and (val == CELL_UNKNOWN or val == CELL_UNKNOWN_NUMBER):
-                    bg_color = QColor(*COLOR_MINE_HIGHLIGHT)
-                elif val >= 0:
-                    bg_color = QColor(*COLOR_REVEALED)
-                else:
-                    bg_color = QColor(*COLOR_UNKNOWN)
-
-                # Draw cell background
-                painter.fillRect(x, y, cell_size, cell_size, bg_color)
-
-                # Draw cell border
-                painter.setPen(QPen(QColor(*COLOR_GRID_BORDER), 1))
-                painter.drawRect(x, y, cell_size, cell_size)
+                # Background and border come pre-composed in the state tile
+                draw_pixmap(x, y, tiles[bg_indices[r, c]])
 
                 # Draw cell text
                 text = ""
-                color = QColor(20, 20, 20)
+                color = self._text_default
                 if val == CELL_FLAG:
                     text = "F"
-                    color = QColor(200, 0, 0)
+                    color = self._text_flag
                 elif val == CELL_UNKNOWN_NUMBER:
                     text = "?"
-                    color = QColor(100, 100, 100)
+                    color = self._text_unknown_number
                 elif val >= 0:
                     text = str(val)
-                    rgb = NUMBER_COLORS.get(val, (0, 0, 0))
-                    color = QColor(*rgb)
+                    color = self._number_colors.get(val, self._text_default)
 
                 if text:
-                    font_size = max(10, int(cell_size * 0.5))
-                    font = QFont()
-                    font.setPointSize(font_size)
-                    font.setBold(True)
-                    painter.setFont(font)
-                    painter.setPen(color)
-                    painter.drawText(x, y, cell_size, cell_size, Qt.AlignmentFlag.AlignCenter, text)
+                    draw_pixmap(x, y, self._cell_glyph(text, color, cell_size))
+
+        painter.end()
+
+        self._rendered_version = self.presenter.get_state_version()
 
     def mousePressEvent(self, event):
         """Handle mouse click on grid."""
         if not self.presenter:
             return
 
-        origin_x, origin_y = self._grid_origin()
+        cell_size, origin_x, origin_y, rows, cols = self._grid_layout()
         x = event.position().x()
         y = event.position().y()
 
         if x < origin_x or y < origin_y:
             return
 
-        cell_size = self._calculate_cell_size()
         col = int((x - origin_x) // cell_size)
         row = int((y - origin_y) // cell_size)
 
-        if not (0 <= row < self.presenter.get_rows() and 0 <= col < self.presenter.get_cols()):
+        if not (0 <= row < rows and 0 <= col < cols):
             return
 
-        button = event.button()
-        if button == Qt.MouseButton.LeftButton:
-            self.presenter.on_cell_click(row, col, 1)
-        elif button == Qt.MouseButton.RightButton:
-            self.presenter.on_cell_click(row, col, 3)
-
-        self.update()
+        # The presenter calls update_display() after mutating the state,
+        # which invalidates this widget; scheduling a second repaint here
+        # would just redo the dirty bookkeeping
+        button = _BUTTON_MAP.get(event.button())
+        if button is not None:
+            self.presenter.on_cell_click(row, col, button)
 
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts."""
         if event.key() == Qt.Key.Key_Z and event.modifiers() & Qt.KeyboardModifier.ControlModifier:
             if self.presenter:
+                # update_display() fires from the presenter only when the
+                # undo actually changed something
                 self.presenter.on_undo_click()
-                self.update()
 
 
 class MinesweeperPyQt(QMainWindow):
@@ -197,8 +361,14 @@ class MinesweeperPyQt(QMainWindow):
         # Status display
         self.status_text = ""
         self.status_timer = QTimer()
+        self.status_timer.setSingleShot(True)
         self.status_timer.timeout.connect(self._clear_status)
 
+        # Set when a display update arrives while the window is minimized;
+        # the refresh is replayed on restore instead of re-rendering a grid
+        # nobody can see
+        self._update_pending = False
+
         # Initialize UI
         self._init_ui()
 
@@ -436,27 +606,45 @@ class MinesweeperPyQt(QMainWindow):
 
     def _clear_status(self):
         """Clear status after timeout."""
-        self.status_timer.stop()
         if self.status_label.text():
             self.status_label.setStyleSheet("color: #787878;")
 
     def update_display(self):
         """Update the display (called by presenter when state changes)."""
-        self.grid_widget.update()
+        if self.isMinimized():
+            self._update_pending = True
+            return
+        self.grid_widget.invalidate()
+
+    def changeEvent(self, event):
+        """Replay a deferred display update when the window is restored."""
+        if event.type() == QEvent.Type.WindowStateChange and not self.isMinimized() and self._update_pending:
+            self._update_pending = False
+            self.grid_widget.invalidate()
+        super().changeEvent(event)
 
     def on_grid_size_changed(self):
         """Called when grid size changes to update UI."""
         if self.presenter:
-            self.size_combo.blockSignals(True)
-            self.size_combo.setCurrentText(str(self.presenter.get_rows()))
-            self.size_combo.blockSignals(False)
-
-            self.mines_spin.blockSignals(True)
-            self.mines_spin.setMaximum(self.presenter.get_rows() * self.presenter.get_cols())
-            self.mines_spin.setValue(self.presenter.get_total_mines())
-            self.mines_spin.blockSignals(False)
-
-        self.grid_widget.update()
+            # Only touch the controls whose value actually moved: each
+            # setter triggers a style/geometry pass even with signals
+            # blocked, and this handler also fires for captures that keep
+            # the same size
+            size_text = str(self.presenter.get_rows())
+            if self.size_combo.currentText() != size_text:
+                self.size_combo.blockSignals(True)
+                self.size_combo.setCurrentText(size_text)
+                self.size_combo.blockSignals(False)
+
+            max_mines = self.presenter.get_rows() * self.presenter.get_cols()
+            total_mines = self.presenter.get_total_mines()
+            if self.mines_spin.maximum() != max_mines or self.mines_spin.value() != total_mines:
+                self.mines_spin.blockSignals(True)
+                self.mines_spin.setMaximum(max_mines)
+                self.mines_spin.setValue(total_mines)
+                self.mines_spin.blockSignals(False)
+
+        self.grid_widget.invalidate()
 
     def run(self):
         """Main entry point to run the application."""
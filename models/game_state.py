@@ -1,5 +1,7 @@
 """Game state model for Minesweeper solver."""
 
+import numpy as np
+
 from core.constants import CELL_UNKNOWN, CELL_FLAG, CELL_UNKNOWN_NUMBER
 
 
@@ -20,12 +22,18 @@ class GameState:
         self.variant = variant
         self.total_mines = total_mines
 
-        # Initialize board state
-        self.board_state = [[CELL_UNKNOWN] * cols for _ in range(rows)]
+        # Board state as a contiguous int8 array: cell reads are plain
+        # array lookups and the solver/NumPy code consume it directly
+        # without per-cell boxing
+        self.board_state = np.full((rows, cols), CELL_UNKNOWN, dtype=np.int8)
         self.history = []  # For undo functionality
         self.safe_highlights = set()  # Cells highlighted as safe by solver
         self.mine_highlights = set()  # Cells highlighted as mines by solver
 
+        # Monotonic counter bumped on every board/highlight mutation, so
+        # views can compare versions instead of diffing board contents
+        self.state_version = 0
+
     def reset(self, preserve_board: bool = False):
         """Reset the game state to initial configuration.
 
@@ -33,10 +41,16 @@ class GameState:
             preserve_board: If True, preserve the board state (for variant switching)
         """
         if not preserve_board:
-            self.board_state = [[CELL_UNKNOWN] * self.cols for _ in range(self.rows)]
+            if self.board_state.shape == (self.rows, self.cols):
+                # Same shape: clear the existing buffer in place instead of
+                # reallocating a fresh array on every reset click
+                self.board_state.fill(CELL_UNKNOWN)
+            else:
+                self.board_state = np.full((self.rows, self.cols), CELL_UNKNOWN, dtype=np.int8)
         self.history = []
         self.safe_highlights = set()
         self.mine_highlights = set()
+        self.state_version += 1
 
     def cycle_cell(self, row, col):
         """Cycle a cell through possible values (unknown → 0 → 1 → 2 → ... → 8 → unknown).
@@ -45,7 +59,7 @@ class GameState:
             row: Row index of the cell
             col: Column index of the cell
         """
-        current = self.board_state[row][col]
+        current = int(self.board_state[row, col])
         self._push_history(row, col, current)
 
         if current == CELL_UNKNOWN:
@@ -59,8 +73,9 @@ class GameState:
         else:
             new_val = current + 1
 
-        self.board_state[row][col] = new_val
+        self.board_state[row, col] = new_val
         self._clear_highlights()
+        self.state_version += 1
 
     def toggle_flag(self, row, col):
         """Toggle a cell between unknown and flag states.
@@ -69,15 +84,16 @@ class GameState:
             row: Row index of the cell
             col: Column index of the cell
         """
-        current = self.board_state[row][col]
+        current = int(self.board_state[row, col])
         self._push_history(row, col, current)
 
         if current == CELL_FLAG:
-            self.board_state[row][col] = CELL_UNKNOWN
+            self.board_state[row, col] = CELL_UNKNOWN
         else:
-            self.board_state[row][col] = CELL_FLAG
+            self.board_state[row, col] = CELL_FLAG
 
         self._clear_highlights()
+        self.state_version += 1
 
     def undo(self):
         """Undo the last cell modification."""
@@ -85,8 +101,9 @@ class GameState:
             return False
 
         r, c, previous_val = self.history.pop()
-        self.board_state[r][c] = previous_val
+        self.board_state[r, c] = previous_val
         self._clear_highlights()
+        self.state_version += 1
         return True
 
     def _push_history(self, row, col, value):
@@ -149,9 +166,9 @@ class GameState:
         Returns:
             True if variant changed, False otherwise
         """
-        from core.constants import VARIANT_TYPES
+        from core.constants import VARIANT_INDEX
 
-        if variant not in VARIANT_TYPES or variant == self.variant:
+        if variant not in VARIANT_INDEX or variant == self.variant:
             return False
 
         self.variant = variant
@@ -190,6 +207,7 @@ class GameState:
         """
         self.safe_highlights = set(safe_cells)
         self.mine_highlights = set(mine_cells)
+        self.state_version += 1
 
     def set_board_from_capture(self, rows: int, cols: int, board_state: list):
         """Set board state from screen capture.
@@ -201,8 +219,9 @@ class GameState:
         """
         self.rows = rows
         self.cols = cols
-        self.board_state = board_state
+        self.board_state = np.asarray(board_state, dtype=np.int8)
         self.total_mines = min(self.total_mines, rows * cols)
         self.history = []
         self.safe_highlights = set()
         self.mine_highlights = set()
+        self.state_version += 1